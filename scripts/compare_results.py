@@ -11,14 +11,72 @@ Usage:
 
 import argparse
 import json
+import mmap
+import os
 import re
+import stat
 import sys
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-
-@dataclass
+from typing import NamedTuple, Optional
+
+# orjson is optional; it only speeds up --json output for large result sets
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Benchmark name normalization: prefixes/-N suffix and separators to drop
+_NORM_STRIP = re.compile(r'^(?:Benchmark|bench_)|-\d+$')
+_NORM_TRANS = str.maketrans('', '', '_/')
+
+# Nanoseconds per criterion time unit
+_UNIT_NS = {
+    'ns': 1, 'nanoseconds': 1,
+    'µs': 1_000, 'us': 1_000, 'microseconds': 1_000,
+    'ms': 1_000_000, 'milliseconds': 1_000_000,
+    's': 1_000_000_000, 'seconds': 1_000_000_000,
+}
+
+# Status ranks for summary counts (higher is better)
+_STATUS_RANK = {'excellent': 3, 'good': 2, 'acceptable': 1, 'needs_work': 0}
+
+# Rust/Go ratio upper bounds (inclusive) for each status; <= 1.0 means
+# Rust is faster
+_RATIO_THRESHOLDS = (1.0, 2.0, 5.0)
+_RATIO_LABELS = ('excellent', 'good', 'acceptable', 'needs_work')
+
+# Display units for format_time: values below each bound use the matching
+# (divisor, suffix, format spec) entry, anything larger is shown in seconds
+_TIME_BOUNDS = (1_000, 1_000_000, 1_000_000_000)
+_TIME_UNITS = (
+    (1, 'ns', '.1f'),
+    (1_000, 'µs', '.1f'),
+    (1_000_000, 'ms', '.1f'),
+    (1_000_000_000, 's', '.2f'),
+)
+
+# Benchmark logs are scanned as bytes (memory-mapped when possible), so the
+# criterion patterns are bytes patterns. Units are matched as non-space runs
+# rather than \w+ because bytes-mode \w is ASCII-only and would reject "µs".
+
+# Criterion output patterns
+# Group header: lipgloss/rendering
+# Bench name line: render/short/simple
+# Time line: time:   [1.2345 µs 1.2456 µs 1.2567 µs]
+_TIME_PATTERN = re.compile(
+    rb'time:\s+\[([\d.]+)\s+([^\s\]]+)\s+([\d.]+)\s+([^\s\]]+)\s+([\d.]+)\s+([^\s\]]+)\]'
+)
+
+# Also match simpler criterion output format
+_SIMPLE_PATTERN = re.compile(
+    rb'^\s*(\S+)\s+time:\s+\[([\d.]+)\s+([^\s\]]+)'
+)
+
+
+@dataclass(slots=True)
 class BenchResult:
     """A single benchmark result."""
     name: str
@@ -28,50 +86,86 @@ class BenchResult:
     source: str = ""
 
 
+class Comparison(NamedTuple):
+    """A Go/Rust pairing for one normalized benchmark name."""
+    normalized_name: str
+    go_name: Optional[str]
+    rust_name: Optional[str]
+    go_ns: Optional[float]
+    rust_ns: Optional[float]
+    ratio: Optional[float]
+    status: str
+
+
 def normalize_name(name: str) -> str:
     """Normalize benchmark names for matching between Go and Rust."""
-    # Remove common prefixes
-    name = re.sub(r'^Benchmark', '', name)
-    name = re.sub(r'^bench_', '', name)
+    # Remove common prefixes and trailing numbers (like -8 for GOMAXPROCS),
+    # then drop separators
+    return _NORM_STRIP.sub('', name).translate(_NORM_TRANS).lower()
 
-    # Normalize separators
-    name = name.replace('_', '').replace('/', '').lower()
 
-    # Remove trailing numbers (like -8 for GOMAXPROCS)
-    name = re.sub(r'-\d+$', '', name)
+@contextmanager
+def read_lines(path: Path):
+    """Yield an iterator over the raw byte lines of a file.
 
-    return name
+    Regular files are memory-mapped. Pipes, FIFOs and process substitution
+    report a size of 0 and cannot be mapped, so they (and genuinely empty
+    files, which mmap rejects) are read through the file object instead.
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            yield f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield iter(mm.readline, b'')
 
 
 def parse_go_bench(path: Path) -> dict[str, BenchResult]:
     """Parse Go benchmark output."""
     results = {}
 
-    # Pattern: BenchmarkName-8    1000    1234 ns/op    56 B/op    2 allocs/op
-    pattern = re.compile(
-        r'^Benchmark(\S+?)(?:-\d+)?\s+'  # Name with optional -N suffix
-        r'(\d+)\s+'                       # Iterations
-        r'([\d.]+)\s+ns/op'              # Time per op
-        r'(?:\s+(\d+)\s+B/op)?'          # Optional bytes per op
-        r'(?:\s+(\d+)\s+allocs/op)?'     # Optional allocs per op
-    )
-
-    with open(path) as f:
-        for line in f:
-            match = pattern.match(line.strip())
-            if match:
-                name = match.group(1)
-                ns = float(match.group(3))
-                bytes_op = int(match.group(4)) if match.group(4) else None
-                allocs_op = int(match.group(5)) if match.group(5) else None
-
-                results[normalize_name(name)] = BenchResult(
-                    name=f"Benchmark{name}",
-                    ns_per_op=ns,
-                    bytes_per_op=bytes_op,
-                    allocs_per_op=allocs_op,
-                    source="go"
-                )
+    with read_lines(path) as lines:
+        for line in lines:
+            if b'Benchmark' not in line:
+                continue
+
+            # Fields are whitespace-delimited: name, iterations, then
+            # (value, unit) pairs starting with ns/op. Leading whitespace
+            # is allowed, so indented rows are still picked up.
+            parts = line.split()
+            if (len(parts) < 4 or not parts[0].startswith(b'Benchmark')
+                    or parts[3] != b'ns/op' or not parts[1].isdigit()):
+                continue
+
+            # Drop the -N GOMAXPROCS suffix
+            name = parts[0][len(b'Benchmark'):].decode()
+            base, sep, procs = name.rpartition('-')
+            if sep and base and procs.isdigit():
+                name = base
+            if not name:
+                continue
+
+            try:
+                ns = float(parts[2])
+            except ValueError:
+                continue
+
+            bytes_op = None
+            allocs_op = None
+            for value, unit in zip(parts[4::2], parts[5::2]):
+                if unit == b'B/op' and value.isdigit():
+                    bytes_op = int(value)
+                elif unit == b'allocs/op' and value.isdigit():
+                    allocs_op = int(value)
+
+            results[normalize_name(name)] = BenchResult(
+                name=f"Benchmark{name}",
+                ns_per_op=ns,
+                bytes_per_op=bytes_op,
+                allocs_per_op=allocs_op,
+                source="go"
+            )
 
     return results
 
@@ -81,38 +175,34 @@ def parse_rust_bench(path: Path) -> dict[str, BenchResult]:
     results = {}
     current_name = None
 
-    # Criterion output patterns
-    # Group header: lipgloss/rendering
-    # Bench name line: render/short/simple
-    # Time line: time:   [1.2345 µs 1.2456 µs 1.2567 µs]
-
-    name_pattern = re.compile(r'^(\S+/\S+)\s*$|^(\S+)\s+time:')
-    time_pattern = re.compile(
-        r'time:\s+\[([\d.]+)\s+(\w+)\s+([\d.]+)\s+(\w+)\s+([\d.]+)\s+(\w+)\]'
-    )
-
-    # Also match simpler criterion output format
-    simple_pattern = re.compile(
-        r'^(\S+)\s+time:\s+\[([\d.]+)\s+(\w+)'
-    )
-
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-
-            # Try to match benchmark name
-            name_match = name_pattern.match(line)
-            if name_match:
-                current_name = name_match.group(1) or name_match.group(2)
-                if current_name:
-                    current_name = current_name.replace('/', '_')
+    with read_lines(path) as lines:
+        # Header lines carry state into later time lines, so criterion
+        # output is walked line by line
+        for line in lines:
+            # Patterns tolerate surrounding whitespace, so lines are
+            # matched as read without stripping
+
+            # Most lines carry no timing; only a group header matters there
+            if b'time:' not in line:
+                if b'/' in line:
+                    fields = line.split()
+                    if len(fields) == 1 and b'/' in fields[0][1:-1]:
+                        current_name = fields[0].decode().replace('/', '_')
+                continue
+
+            # Bench name line: a single token directly before time:
+            head = line[:line.index(b'time:')]
+            fields = head.split()
+            named = len(fields) == 1 and head[-1:].isspace()
+            if named:
+                current_name = fields[0].decode().replace('/', '_')
 
             # Try to match time line
-            time_match = time_pattern.search(line)
+            time_match = _TIME_PATTERN.search(line)
             if time_match and current_name:
                 # Use the middle (median) value
                 median_val = float(time_match.group(3))
-                unit = time_match.group(4)
+                unit = time_match.group(4).decode()
 
                 # Convert to nanoseconds
                 ns = convert_to_ns(median_val, unit)
@@ -125,11 +215,11 @@ def parse_rust_bench(path: Path) -> dict[str, BenchResult]:
                 current_name = None
 
             # Try simpler format
-            simple_match = simple_pattern.match(line)
+            simple_match = _SIMPLE_PATTERN.match(line) if named else None
             if simple_match:
-                name = simple_match.group(1)
+                name = simple_match.group(1).decode()
                 val = float(simple_match.group(2))
-                unit = simple_match.group(3)
+                unit = simple_match.group(3).decode()
 
                 ns = convert_to_ns(val, unit)
 
@@ -144,60 +234,38 @@ def parse_rust_bench(path: Path) -> dict[str, BenchResult]:
 
 def convert_to_ns(value: float, unit: str) -> float:
     """Convert time value to nanoseconds."""
-    unit = unit.lower()
-    if unit in ('ns', 'nanoseconds'):
-        return value
-    elif unit in ('µs', 'us', 'microseconds'):
-        return value * 1000
-    elif unit in ('ms', 'milliseconds'):
-        return value * 1_000_000
-    elif unit in ('s', 'seconds'):
-        return value * 1_000_000_000
-    else:
-        # Assume nanoseconds
-        return value
+    # Unknown units are assumed to be nanoseconds
+    return value * _UNIT_NS.get(unit.lower(), 1)
 
 
-def compare_results(go_results: dict, rust_results: dict) -> list[dict]:
+def compare_results(go_results: dict, rust_results: dict) -> list[Comparison]:
     """Compare Go and Rust benchmark results."""
+    # Rows are built positionally in Comparison field order; keyword
+    # arguments make the generated __new__ noticeably slower
     comparisons = []
+    append = comparisons.append
 
-    # Find matching benchmarks
-    all_names = set(go_results.keys()) | set(rust_results.keys())
-
-    for norm_name in sorted(all_names):
+    # Sort the names once up front; rows come out in order and callers
+    # never re-sort
+    for norm_name in sorted(go_results.keys() | rust_results.keys()):
         go_res = go_results.get(norm_name)
         rust_res = rust_results.get(norm_name)
 
-        comparison = {
-            'normalized_name': norm_name,
-            'go_name': go_res.name if go_res else None,
-            'rust_name': rust_res.name if rust_res else None,
-            'go_ns': go_res.ns_per_op if go_res else None,
-            'rust_ns': rust_res.ns_per_op if rust_res else None,
-            'ratio': None,
-            'status': 'missing_both'
-        }
-
-        if go_res and rust_res:
+        if go_res is not None and rust_res is not None:
+            ratio = None
+            status = 'missing_both'
             if go_res.ns_per_op > 0:
                 ratio = rust_res.ns_per_op / go_res.ns_per_op
-                comparison['ratio'] = ratio
-
-                if ratio <= 1.0:
-                    comparison['status'] = 'excellent'  # Rust is faster
-                elif ratio <= 2.0:
-                    comparison['status'] = 'good'
-                elif ratio <= 5.0:
-                    comparison['status'] = 'acceptable'
-                else:
-                    comparison['status'] = 'needs_work'
-        elif go_res:
-            comparison['status'] = 'missing_rust'
-        elif rust_res:
-            comparison['status'] = 'missing_go'
-
-        comparisons.append(comparison)
+                status = _RATIO_LABELS[bisect_left(_RATIO_THRESHOLDS, ratio)]
+
+            append(Comparison(norm_name, go_res.name, rust_res.name,
+                              go_res.ns_per_op, rust_res.ns_per_op, ratio, status))
+        elif go_res is not None:
+            append(Comparison(norm_name, go_res.name, None,
+                              go_res.ns_per_op, None, None, 'missing_rust'))
+        else:
+            append(Comparison(norm_name, None, rust_res.name,
+                              None, rust_res.ns_per_op, None, 'missing_go'))
 
     return comparisons
 
@@ -207,25 +275,23 @@ def format_time(ns: Optional[float]) -> str:
     if ns is None:
         return "N/A"
 
-    if ns < 1000:
-        return f"{ns:.1f} ns"
-    elif ns < 1_000_000:
-        return f"{ns/1000:.1f} µs"
-    elif ns < 1_000_000_000:
-        return f"{ns/1_000_000:.1f} ms"
-    else:
-        return f"{ns/1_000_000_000:.2f} s"
+    divisor, suffix, spec = _TIME_UNITS[bisect_right(_TIME_BOUNDS, ns)]
+    return f"{ns / divisor:{spec}} {suffix}"
 
 
-def print_table(comparisons: list[dict]) -> None:
+def print_table(comparisons: list[Comparison]) -> None:
     """Print comparison results as a table."""
     # Calculate column widths
-    name_width = max(len(c['normalized_name']) for c in comparisons)
+    name_width = max(len(c.normalized_name) for c in comparisons)
     name_width = max(name_width, 20)
 
+    # Collect all output lines and write them at once
+    out = []
+    append = out.append
+
     # Header
-    print(f"{'Benchmark':<{name_width}}  {'Go':<12}  {'Rust':<12}  {'Ratio':<8}  Status")
-    print("-" * (name_width + 50))
+    append(f"{'Benchmark':<{name_width}}  {'Go':<12}  {'Rust':<12}  {'Ratio':<8}  Status")
+    append("-" * (name_width + 50))
 
     # Status symbols
     symbols = {
@@ -243,16 +309,16 @@ def print_table(comparisons: list[dict]) -> None:
     good_count = 0
 
     for comp in comparisons:
-        name = comp['normalized_name'][:name_width]
-        go_time = format_time(comp['go_ns'])
-        rust_time = format_time(comp['rust_ns'])
-        ratio = f"{comp['ratio']:.2f}x" if comp['ratio'] else "N/A"
-        status = comp['status']
+        name = comp.normalized_name[:name_width]
+        go_time = format_time(comp.go_ns)
+        rust_time = format_time(comp.rust_ns)
+        ratio = f"{comp.ratio:.2f}x" if comp.ratio else "N/A"
+        status = comp.status
         symbol = symbols.get(status, '?')
 
-        print(f"{name:<{name_width}}  {go_time:<12}  {rust_time:<12}  {ratio:<8}  {symbol} {status}")
+        append(f"{name:<{name_width}}  {go_time:<12}  {rust_time:<12}  {ratio:<8}  {symbol} {status}")
 
-        if comp['ratio'] is not None:
+        if comp.ratio is not None:
             matched_count += 1
             if status == 'excellent':
                 excellent_count += 1
@@ -260,21 +326,32 @@ def print_table(comparisons: list[dict]) -> None:
                 good_count += 1
 
     # Summary
-    print()
-    print("=" * 60)
-    print("Summary:")
-    print(f"  Total benchmarks:    {len(comparisons)}")
-    print(f"  Matched (Go+Rust):   {matched_count}")
-    print(f"  Excellent (<=1.0x):  {excellent_count}")
-    print(f"  Good (<=2.0x):       {good_count}")
-    print()
-    print("Legend:")
-    print("  ++ excellent (Rust faster or equal)")
-    print("  +  good (Rust within 2x)")
-    print("  ~  acceptable (Rust within 5x)")
-    print("  !! needs_work (Rust >5x slower)")
-    print("  ?R missing Rust benchmark")
-    print("  ?G missing Go benchmark")
+    out.extend((
+        "",
+        "=" * 60,
+        "Summary:",
+        f"  Total benchmarks:    {len(comparisons)}",
+        f"  Matched (Go+Rust):   {matched_count}",
+        f"  Excellent (<=1.0x):  {excellent_count}",
+        f"  Good (<=2.0x):       {good_count}",
+        "",
+        "Legend:",
+        "  ++ excellent (Rust faster or equal)",
+        "  +  good (Rust within 2x)",
+        "  ~  acceptable (Rust within 5x)",
+        "  !! needs_work (Rust >5x slower)",
+        "  ?R missing Rust benchmark",
+        "  ?G missing Go benchmark",
+    ))
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def dump_json(obj) -> str:
+    """Serialize obj as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
 
 def main():
@@ -299,18 +376,29 @@ def main():
     comparisons = compare_results(go_results, rust_results)
 
     if args.json:
+        # Tally every summary bucket in a single pass
+        matched = excellent = good = acceptable = needs_work = 0
+        for c in comparisons:
+            if c.ratio is not None:
+                matched += 1
+            rank = _STATUS_RANK.get(c.status, -1)
+            excellent += rank == 3
+            good += rank >= 2
+            acceptable += rank >= 1
+            needs_work += rank == 0
+
         output = {
-            'comparisons': comparisons,
+            'comparisons': [c._asdict() for c in comparisons],
             'summary': {
                 'total': len(comparisons),
-                'matched': sum(1 for c in comparisons if c['ratio'] is not None),
-                'excellent': sum(1 for c in comparisons if c['status'] == 'excellent'),
-                'good': sum(1 for c in comparisons if c['status'] in ('excellent', 'good')),
-                'acceptable': sum(1 for c in comparisons if c['status'] in ('excellent', 'good', 'acceptable')),
-                'needs_work': sum(1 for c in comparisons if c['status'] == 'needs_work'),
+                'matched': matched,
+                'excellent': excellent,
+                'good': good,
+                'acceptable': acceptable,
+                'needs_work': needs_work,
             }
         }
-        print(json.dumps(output, indent=2))
+        print(dump_json(output))
     else:
         print_table(comparisons)
 